@@ -21,7 +21,8 @@ setup(
         ]
     },
     extras_require={
-        "dev": []
+        "dev": [],
+        "blake3": ["blake3"],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
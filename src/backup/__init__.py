@@ -1,11 +1,32 @@
 import re
+import io
+import importlib
+import json
+import mmap
+import functools
+import os
+import gzip
+import shutil
+import stat
+import subprocess
 import tarfile
-from pathlib import Path, PurePath
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from datetime import datetime, timezone
 import hashlib
 from os import makedirs
+from types import ModuleType
+from typing import Deque, Dict, Optional, Tuple, Union
 
-__all__ = ["BackupManager", "manager", "WILDCARD", "EXACT"]
+blake3: Optional[ModuleType]
+try:
+    blake3 = importlib.import_module("blake3")
+except ImportError:
+    blake3 = None
+
+__all__ = ["BackupManager", "manager", "WILDCARD", "EXACT", "HASH_ALGORITHMS"]
 
 __version__ = "0.2.1"
 
@@ -16,16 +37,159 @@ makedirs(backup_path, exist_ok=True)
 WILDCARD = "wildcard"
 EXACT = "exact"
 
+HASH_ALGORITHMS = ("sha256", "blake2b", "blake3")
+
+_HASH_CHUNK_SIZE = 1 << 20
+_HASH_VIEW = memoryview(bytearray(_HASH_CHUNK_SIZE))
+_HASH_LOCK = threading.Lock()
+_HASH_PROTOTYPES: Dict[str, Union["hashlib._Hash", hashlib.blake2b]] = {
+    "sha256": hashlib.sha256(),
+    "blake2b": hashlib.blake2b(digest_size=32),
+}
+_EXTRACT_BUFFER_SIZE = 1 << 20
+
+_COMPRESS_LEVEL = 6
+_TAR_BUFFER_SIZE = 1 << 20
+
+_INCOMPRESSIBLE_SUFFIXES = frozenset({
+    ".7z", ".avi", ".bz2", ".gif", ".gz", ".jar", ".jpeg", ".jpg", ".mkv", ".mov", ".mp3", ".mp4",
+    ".png", ".rar", ".tgz", ".webm", ".webp", ".whl", ".xz", ".zip", ".zst",
+})
+
+_PREFETCH_MAX_SIZE = 1 << 20
+_PREFETCH_DEPTH = 4
+
+_compile_rule = functools.lru_cache(maxsize=512)(re.compile)
+
+_SANITIZE_RE = re.compile(r'[\\/*?:"<>|]')
+
+_ARCHIVE_NAME_RE = re.compile(r"^\d{4}(?:-\d{2}){5}-(.+)\.tar\.gz$")
+
+# Regex emitted by _pattern_to_regex for a literal "dir/**" rule; older versions
+# translated "**" to "[^/]*[^/]*", and rules saved by them are still recognised.
+_DIR_RULE_RE = re.compile(
+    r"\^((?:[^\\.*?+()\[\]{}|^$]|\\\.)+)/(?:\.\*\?|\[\^/\]\*\[\^/\]\*)\(/\.\*\)\?\$"
+)
+
+_DEFAULT_RULES = (
+    (_compile_rule(r"^\..*"), WILDCARD),
+    (_compile_rule("backup/**".replace("**", r".*?")), WILDCARD),
+)
+
+@functools.lru_cache(maxsize=512)
+def _translate_pattern(pattern: str) -> str:
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "*":
+            if pattern.startswith("**", i):
+                parts.append(".*?")
+                i += 2
+                continue
+            parts.append("[^/]*")
+        elif char == ".":
+            parts.append(r"\.")
+        else:
+            parts.append(char)
+        i += 1
+
+    regex = "".join(parts)
+    if "**" in pattern:
+        return f"^{regex}(/.*)?$"
+    return f"^{regex}$"
+
+def _read_small_file(path: str):
+    st = os.lstat(path)
+    if not stat.S_ISREG(st.st_mode) or st.st_size > _PREFETCH_MAX_SIZE:
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+def _checked_members(tar: tarfile.TarFile, dest: str):
+    # Interpreters without extraction filters get the same path checks as filter="tar".
+    dest = os.path.realpath(dest)
+    for member in tar:
+        names = [member.name]
+        if member.islnk():
+            names.append(member.linkname)
+        for name in names:
+            target = os.path.realpath(os.path.join(dest, name))
+            if os.path.isabs(name) or os.path.commonpath([dest, target]) != dest:
+                raise tarfile.TarError(f"{name!r} would be extracted outside the destination")
+        yield member
+
+class _GzipMemberWriter:
+    # Writes a multi-member gzip stream; each set_level() change starts a new member.
+    def __init__(self, fileobj, compresslevel: int):
+        self._fileobj = fileobj
+        self._level = compresslevel
+        self._member = gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=compresslevel)
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def set_level(self, compresslevel: int):
+        if compresslevel == self._level:
+            return
+        self.flush()
+        self._member.close()
+        self._member = gzip.GzipFile(fileobj=self._fileobj, mode="wb", compresslevel=compresslevel)
+        self._level = compresslevel
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._offset += len(data)
+        if len(self._buffer) >= _TAR_BUFFER_SIZE:
+            self.flush()
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def flush(self):
+        if self._buffer:
+            self._member.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self):
+        self.flush()
+        self._member.close()
+
+def _new_hasher(algo: str):
+    if algo == "blake3":
+        if blake3 is None:
+            raise RuntimeError("blake3 hashing requires the blake3 package: pip install backupworkspace[blake3]")
+        # BLAKE3's tree mode hashes a large update() across all cores.
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    if algo not in _HASH_PROTOTYPES:
+        raise ValueError(f"Unsupported hash algorithm: {algo}")
+    return _HASH_PROTOTYPES[algo].copy()
+
+def _update_from_file(hasher, f):
+    if os.fstat(f.fileno()).st_size == 0:
+        # Empty files cannot be mapped and have nothing to hash.
+        return
+
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # Some special filesystems cannot be mapped.
+        mapped = None
+
+    if mapped is not None:
+        with mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            hasher.update(mapped)
+        return
+
+    with _HASH_LOCK:
+        while n := f.readinto(_HASH_VIEW):
+            hasher.update(_HASH_VIEW[:n])
+
 class BackupManager:
     def __init__(self):
-        self.exclude_rules = [
-            (re.compile(r"^\..*"), "wildcard"),
-            (re.compile("backup/**".replace("**", r".*?")), "wildcard"),
-        ]
-        self._validate_methods = {
-            "exact": self._match_exact,
-            "wildcard": self._match_wildcard,
-        }
+        self.exclude_rules = list(_DEFAULT_RULES)
 
     def add_exclusion_rule(self, pattern: str, match_type: str = "wildcard"):
         pattern = pattern.replace("\\", "/").rstrip("/")
@@ -33,38 +197,130 @@ class BackupManager:
         self._validate_pattern(pattern)
 
         regex = self._pattern_to_regex(pattern)
-        self.exclude_rules.append((re.compile(regex), match_type))
+        self.exclude_rules.append((_compile_rule(regex), match_type))
+
+    def _combine_rules(self):
+        self._dir_prefixes = set()
+        for pattern, _ in self.exclude_rules:
+            if match := _DIR_RULE_RE.fullmatch(pattern.pattern):
+                self._dir_prefixes.add(match.group(1).replace("\\.", "."))
+
+        matchers = []
+        for match_type in (WILDCARD, EXACT):
+            patterns = [
+                pattern.pattern for pattern, rule_type in self.exclude_rules if rule_type == match_type
+            ]
+            if patterns:
+                regex = _compile_rule("|".join(f"(?:{pattern})" for pattern in patterns))
+                matchers.append(regex.search if match_type == WILDCARD else regex.fullmatch)
+        self._matchers = tuple(matchers)
 
     def create_backup(self, backup_name: str, show_log=False):
         sanitized_name = self._sanitize_filename(backup_name)
-        backup_dir = Path.cwd() / ".xystudio" / "backup"
+        # exclude_rules is a plain list callers may edit freely, so combine it once per backup.
+        self._combine_rules()
+        root = os.getcwd()
+        backup_dir = Path(root, ".xystudio", "backup")
         backup_dir.mkdir(exist_ok=True)
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H-%M-%S")
 
         temp_file = backup_dir / f"{timestamp}-{sanitized_name}.tmp"
 
-        with tarfile.open(temp_file, "w:gz") as tar:
-            for file_path in self._walk_directory(Path.cwd()):
-                if show_log:
-                    print("adding ", file_path)
-                rel_path = file_path.relative_to(Path.cwd())
-                if not self._should_exclude(rel_path):
-                    tar.add(file_path, arcname=str(rel_path))
+        pigz = shutil.which("pigz")
+        try:
+            if pigz:
+                self._compress_with_pigz(pigz, temp_file, root, show_log)
+            else:
+                with open(temp_file, "wb") as out:
+                    gz = _GzipMemberWriter(out, _COMPRESS_LEVEL)
+                    # typeshed's tarfile.open overloads omit copybufsize, which TarFile accepts.
+                    with tarfile.open(  # type: ignore[call-overload]
+                        fileobj=gz, mode="w", copybufsize=_TAR_BUFFER_SIZE
+                    ) as tar:
+                        self._add_files(tar, root, show_log, gz)
+                    gz.close()
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
 
         final_name = f"{timestamp}-{sanitized_name}.tar.gz"
         final_path = backup_dir / final_name
         temp_file.rename(final_path)
+
+        # The rename changed the folder's mtime, so the stored index is stale either way.
+        _rebuild_backup_index()
         return final_path
 
-    def delete_backup(self, backup_name: str, index: int = None):
-        backups = list(Path(".xystudio", "backup").glob("*.tar.gz"))
-        matched = []
+    def _compress_with_pigz(self, pigz: str, temp_file: Path, root: str, show_log=False):
+        with open(temp_file, "wb") as out:
+            proc = subprocess.Popen(
+                [pigz, f"-{_COMPRESS_LEVEL}", "-p", str(os.cpu_count() or 1)],
+                stdin=subprocess.PIPE,
+                stdout=out,
+            )
+            stdin = proc.stdin
+            assert stdin is not None
+            broken_pipe = False
+            try:
+                with tarfile.open(  # type: ignore[call-overload]
+                    fileobj=stdin, mode="w|", bufsize=_TAR_BUFFER_SIZE, copybufsize=_TAR_BUFFER_SIZE
+                ) as tar:
+                    self._add_files(tar, root, show_log)
+            except BrokenPipeError:
+                # pigz exited early; its exit status below says why.
+                broken_pipe = True
+            finally:
+                try:
+                    stdin.close()
+                except BrokenPipeError:
+                    broken_pipe = True
+                returncode = proc.wait()
+
+        if broken_pipe or returncode != 0:
+            raise RuntimeError(f"Compression failed: pigz exited with {returncode}")
+
+    def _add_files(self, tar: tarfile.TarFile, root: str, show_log=False, gz=None):
+        workers = os.cpu_count() or 1
+        pending: Deque[Tuple[str, str, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for file_path, rel_path in self._walk_directory(root):
+                if show_log:
+                    print("adding ", file_path)
+                if self._should_exclude(rel_path):
+                    continue
+
+                pending.append((file_path, rel_path, executor.submit(_read_small_file, file_path)))
+                if len(pending) >= workers * _PREFETCH_DEPTH:
+                    file_path, rel_path, future = pending.popleft()
+                    self._add_file(tar, file_path, rel_path, future.result(), gz)
+
+            while pending:
+                file_path, rel_path, future = pending.popleft()
+                self._add_file(tar, file_path, rel_path, future.result(), gz)
+
+    def _add_file(self, tar: tarfile.TarFile, file_path: str, rel_path: str, content, gz=None):
+        if gz is not None:
+            # Only files too large to prefetch are worth a separate stored member.
+            store = content is None and os.path.splitext(rel_path)[1].lower() in _INCOMPRESSIBLE_SUFFIXES
+            gz.set_level(0 if store else _COMPRESS_LEVEL)
+
+        tarinfo = tar.gettarinfo(file_path, arcname=rel_path)
+        if tarinfo is None:
+            # Sockets and other unsupported types are skipped, as tar.add does.
+            return
 
-        for file in backups:
-            name_part = "".join(file.stem.split("-")[-1].split(".")[:-1])
-            if name_part == backup_name:
-                matched.append(file)
+        if not tarinfo.isreg():
+            tar.addfile(tarinfo)
+        elif content is not None:
+            tarinfo.size = len(content)
+            tar.addfile(tarinfo, io.BytesIO(content))
+        else:
+            with open(file_path, "rb", buffering=_TAR_BUFFER_SIZE) as f:
+                tar.addfile(tarinfo, f)
+
+    def delete_backup(self, backup_name: str, index: int = None):
+        matched = self._find_backups(backup_name)
 
         if not matched:
             raise ValueError(f"Backup not found: {backup_name}")
@@ -80,16 +336,10 @@ class BackupManager:
         target = matched[index] if index is not None else matched[0]
         target.unlink()
 
-    def extract_backup(self, backup_name: str, index: int = None):
-        import subprocess
-
-        backups = list(Path(".xystudio", "backup").glob("*.tar.gz"))
-        matched = []
+        _rebuild_backup_index()
 
-        for file in backups:
-            name_part = "".join(file.stem.split("-")[-1].split(".")[:-1])
-            if name_part == backup_name:
-                matched.append(file)
+    def extract_backup(self, backup_name: str, index: int = None):
+        matched = self._find_backups(backup_name)
 
         if not matched:
             raise ValueError(f"Backup not found: {backup_name}")
@@ -107,38 +357,46 @@ class BackupManager:
         deep_path = Path(folder_name := str(target)[:-7])
         deep_path.mkdir(parents=True, exist_ok=True)
 
-        cmd = ["tar", "-xzf", str(target), "-C", folder_name]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"Unzip failed: {result.stderr}")
+        try:
+            with gzip.GzipFile(target, "rb") as g, tarfile.open(
+                fileobj=io.BufferedReader(g, buffer_size=_EXTRACT_BUFFER_SIZE), mode="r|"
+            ) as tar:
+                if hasattr(tarfile, "tar_filter"):
+                    tar.extractall(folder_name, filter="tar")
+                else:
+                    tar.extractall(folder_name, members=_checked_members(tar, folder_name))
+        except (OSError, EOFError, tarfile.TarError) as e:
+            raise RuntimeError(f"Unzip failed: {e}") from e
         else:
             print(f"Unzipped file is in ./{folder_name}")
 
-    def _walk_directory(self, root: Path):
-        for path in root.iterdir():
-            rel_path = path.relative_to(root)
-            if self._should_exclude(rel_path):
-                continue
-
-            if path.is_dir():
-                yield from self._walk_directory(path)
-            else:
-                yield path
-
-    def _should_exclude(self, rel_path: PurePath) -> bool:
-        str_path = str(rel_path.as_posix())
-        for pattern, match_type in self.exclude_rules:
-            if self._validate_methods[match_type](str_path, pattern):
+    def _find_backups(self, backup_name: str) -> list:
+        index = _read_backup_index()
+        if index is None:
+            index = _rebuild_backup_index()
+
+        return [Path(".xystudio", "backup", name) for name in index.get(backup_name, [])]
+
+    def _walk_directory(self, root: str, rel: str = ""):
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if self._should_exclude(entry.name):
+                    continue
+
+                rel_path = rel + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if rel_path in self._dir_prefixes:
+                        continue
+                    yield from self._walk_directory(entry.path, rel_path + "/")
+                else:
+                    yield entry.path, rel_path
+
+    def _should_exclude(self, str_path: str) -> bool:
+        for match in self._matchers:
+            if match(str_path):
                 return True
         return False
 
-    def _match_exact(self, path: str, pattern: re.Pattern) -> bool:
-        return bool(pattern.fullmatch(path))
-
-    def _match_wildcard(self, path: str, pattern: re.Pattern) -> bool:
-        return bool(pattern.search(path))
-
     def _validate_pattern(self, pattern: str):
         if "**" in pattern:
             if pattern.count("**") > 1:
@@ -159,29 +417,13 @@ class BackupManager:
                 raise ValueError(f"The pattern contains more than one *: {pattern}")
 
     def _pattern_to_regex(self, pattern: str) -> str:
-        regex = (
-            pattern.replace(".", r"\.")
-            .replace("*", r"[^/]*")
-            .replace("**", r".*?")
-        )
-
-        if "**" in pattern:
-            regex = f"^{regex}(/.*)?$"
-        else:
-            regex = f"^{regex}$"
-
-        return regex
+        return _translate_pattern(pattern)
 
     def _sanitize_filename(self, name: str) -> str:
-        return re.sub(r'[\\/*?:"<>|]', "_", name)
+        return _SANITIZE_RE.sub("_", name)
 
-    def get_backup_hash(self, backup_name: str, index: int = None) -> str:
-        backups = list(Path(".xystudio", "backup").glob("*.tar.gz"))
-        matched = []
-        for file in backups:
-            name_part = "".join(file.stem.split("-")[-1].split(".")[:-1])
-            if name_part == backup_name:
-                matched.append(file)
+    def get_backup_hash(self, backup_name: str, index: int = None, algo: str = "sha256") -> str:
+        matched = self._find_backups(backup_name)
 
         if not matched:
             raise ValueError(f"Backup not found: {backup_name}")
@@ -192,37 +434,81 @@ class BackupManager:
 
         target = matched[index] if index is not None else matched[0]
 
-        sha256_hash = hashlib.sha256()
-        with open(target, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+        hasher = _new_hasher(algo)
+        with open(target, "rb", buffering=0) as f:
+            _update_from_file(hasher, f)
+        return hasher.hexdigest()
 
-    def verify_backup_hash(self, backup_name: str, expected_hash: str, index: int = None) -> bool:
-        actual_hash = self.get_backup_hash(backup_name, index)
+    def verify_backup_hash(
+        self, backup_name: str, expected_hash: str, index: int = None, algo: str = "sha256"
+    ) -> bool:
+        actual_hash = self.get_backup_hash(backup_name, index, algo)
         return actual_hash.lower() == expected_hash.lower()
 
+def _backup_dir_mtime():
+    return os.stat(Path(".xystudio", "backup")).st_mtime_ns
+
+def _read_backup_index():
+    try:
+        with open(Path(".xystudio", "backup", "index.json"), encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    # Adding, removing or renaming any archive changes the folder's mtime, whichever tool did it.
+    if not isinstance(data, dict) or data.get("mtime_ns") != _backup_dir_mtime():
+        return None
+    backups = data.get("backups")
+    return backups if isinstance(backups, dict) else None
+
+def _scan_backup_index():
+    index = {}
+    for file in sorted(Path(".xystudio", "backup").glob("*.tar.gz")):
+        # Strip the "%Y-%m-%d-%H-%M-%S-" timestamp prefix; archives copied in without one keep their stem.
+        match = _ARCHIVE_NAME_RE.match(file.name)
+        index.setdefault(match.group(1) if match else file.name[:-7], []).append(file.name)
+    return index
+
+def _rebuild_backup_index():
+    index_file = Path(".xystudio", "backup", "index.json")
+    # Creating the file changes the folder's mtime; rewriting it in place does not.
+    index_file.touch()
+    # Read the mtime before scanning, so an archive added mid-scan leaves the saved index stale.
+    mtime_ns = _backup_dir_mtime()
+    index = _scan_backup_index()
+    with open(index_file, "w", encoding="utf-8") as f:
+        json.dump({"mtime_ns": mtime_ns, "backups": index}, f, ensure_ascii=False, indent=2)
+    return index
+
 def _read_exclude_rules():
     import pickle
 
+    stored = []
     try:
         with open(backup_path / "excludes.exc", "rb") as f:
-            exclude_rules = pickle.load(f)
-        manager.exclude_rules = exclude_rules
+            # Older versions appended a full rule list on every write, so merge every record.
+            while True:
+                try:
+                    records = pickle.load(f)
+                except EOFError:
+                    break
+                for pattern, match_type in records:
+                    # Older versions pickled compiled patterns rather than strings.
+                    rule = (getattr(pattern, "pattern", pattern), match_type)
+                    if rule not in stored:
+                        stored.append(rule)
     except FileNotFoundError:
-        return [
-            (re.compile(r"^\..*"), "wildcard"),
-            (re.compile("backup/**".replace("**", r".*?")), "wildcard"),
-        ]
-    return exclude_rules
+        return list(_DEFAULT_RULES)
+    return [(_compile_rule(pattern), match_type) for pattern, match_type in stored]
 
 manager = BackupManager()
 
-def _write_exclude_rules(rules = manager.exclude_rules):
+def _write_exclude_rules(rules=None):
     import pickle
 
-    with open(backup_path / "excludes.exc", "ab") as f:
-        pickle.dump(rules, f)
+    if rules is None:
+        rules = manager.exclude_rules
+    with open(backup_path / "excludes.exc", "wb") as f:
+        pickle.dump([(pattern.pattern, match_type) for pattern, match_type in rules], f, protocol=5)
 
 def main():
     import argparse
@@ -230,8 +516,6 @@ def main():
     parser = argparse.ArgumentParser(description="Backup manager")
     subparsers = parser.add_subparsers(dest="command")
 
-    manager.exclude_rules = _read_exclude_rules()
-
     create_parser = subparsers.add_parser("create", help="Create a backup")
     create_parser.add_argument("name", help="Name of the backup")
 
@@ -245,8 +529,11 @@ def main():
 
     verify_parser = subparsers.add_parser("verify", help="Verify a backup")
     verify_parser.add_argument("name", help="Name of the backup")
-    verify_parser.add_argument("hash", help="Expected SHA256 hash of the backup")
+    verify_parser.add_argument("hash", help="Expected hash of the backup")
     verify_parser.add_argument("-i", "--index", type=int, help="Index of the backup to verify")
+    verify_parser.add_argument(
+        "-a", "--algorithm", default="sha256", choices=HASH_ALGORITHMS, help="Hash algorithm"
+    )
 
     exclude_parser = subparsers.add_parser("exclude", help="Add an exclusion rule")
     exclude_parser.add_argument("pattern", help="Pattern to exclude")
@@ -254,12 +541,18 @@ def main():
         "-t", "--type", default="wildcard", choices=["exact", "wildcard"], help="Type of match"
     )
 
-    get_hash_parser = subparsers.add_parser("get_hash", help="Get the SHA256 hash of a backup")
+    get_hash_parser = subparsers.add_parser("get_hash", help="Get the hash of a backup")
     get_hash_parser.add_argument("name", help="Name of the backup")
     get_hash_parser.add_argument("-i", "--index", type=int, help="Index of the backup to get the hash")
+    get_hash_parser.add_argument(
+        "-a", "--algorithm", default="sha256", choices=HASH_ALGORITHMS, help="Hash algorithm"
+    )
 
     args = parser.parse_args()
 
+    if args.command in ("create", "exclude"):
+        manager.exclude_rules = _read_exclude_rules()
+
     if args.command == "create":
         backup_path = manager.create_backup(args.name)
         print(f"Backup created: {backup_path}")
@@ -269,7 +562,7 @@ def main():
     elif args.command == "extract":
         manager.extract_backup(args.name, args.index)
     elif args.command == "verify":
-        if manager.verify_backup_hash(args.name, args.hash, args.index):
+        if manager.verify_backup_hash(args.name, args.hash, args.index, args.algorithm):
             print(f"Backup verified: {args.name}")
         else:
             print(f"Backup verification failed: {args.name}")
@@ -278,7 +571,7 @@ def main():
         _write_exclude_rules(manager.exclude_rules)
         print(f"Exclusion rule added: {args.pattern}")
     elif args.command == "get_hash":
-        print(manager.get_backup_hash(args.name, args.index))
+        print(manager.get_backup_hash(args.name, args.index, args.algorithm))
     else:
         parser.print_help()
 
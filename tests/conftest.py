@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture
+def backup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Imported here so the module's import-time makedirs lands in a temporary workspace.
+    import backup
+
+    monkeypatch.setattr(backup, "backup_path", tmp_path / ".xystudio" / "backup")
+    backup.backup_path.mkdir(parents=True, exist_ok=True)
+    return backup
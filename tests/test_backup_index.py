@@ -0,0 +1,74 @@
+import json
+import shutil
+from pathlib import Path
+
+
+def test_index_rebuilt_when_missing(backup):
+    Path("a.txt").write_text("a")
+    manager = backup.BackupManager()
+    archive = manager.create_backup("proj")
+    index_file = backup.backup_path / "index.json"
+    index_file.unlink()
+
+    assert [path.name for path in manager._find_backups("proj")] == [archive.name]
+    index = json.loads(index_file.read_text(encoding="utf-8"))
+    assert index["backups"] == {"proj": [archive.name]}
+
+
+def test_index_rebuilt_when_stale(backup):
+    Path("a.txt").write_text("a")
+    manager = backup.BackupManager()
+    archive = manager.create_backup("proj")
+    # An archive copied in by hand never goes through the index update.
+    copied = archive.with_name("2000-01-01-00-00-00-proj.tar.gz")
+    shutil.copy(archive, copied)
+
+    found = manager._find_backups("proj")
+    assert [path.name for path in found] == [copied.name, archive.name]
+
+    copied.unlink()
+    assert [path.name for path in manager._find_backups("proj")] == [archive.name]
+
+
+def test_not_found_lookup_keeps_index(backup):
+    Path("a.txt").write_text("a")
+    manager = backup.BackupManager()
+    manager.create_backup("proj")
+    index_file = backup.backup_path / "index.json"
+    written = index_file.stat().st_mtime_ns
+
+    assert manager._find_backups("other") == []
+    assert index_file.stat().st_mtime_ns == written
+
+
+def test_archive_added_during_scan_is_found(backup, monkeypatch):
+    Path("a.txt").write_text("a")
+    manager = backup.BackupManager()
+    archive = manager.create_backup("proj")
+    (backup.backup_path / "index.json").unlink()
+    scan = backup._scan_backup_index
+
+    def scan_then_add():
+        index = scan()
+        # Another process renames an archive in after the scan has listed the folder.
+        shutil.copy(archive, archive.with_name("2000-01-01-00-00-00-other.tar.gz"))
+        return index
+
+    monkeypatch.setattr(backup, "_scan_backup_index", scan_then_add)
+    assert manager._find_backups("other") == []
+    monkeypatch.setattr(backup, "_scan_backup_index", scan)
+
+    assert [path.name for path in manager._find_backups("other")] == [
+        "2000-01-01-00-00-00-other.tar.gz"
+    ]
+
+
+def test_archive_without_timestamp_is_found(backup):
+    Path("a.txt").write_text("a")
+    manager = backup.BackupManager()
+    archive = manager.create_backup("proj")
+    shutil.copy(archive, backup.backup_path / "handmade.tar.gz")
+
+    found = manager._find_backups("handmade")
+    assert [path.name for path in found] == ["handmade.tar.gz"]
+    assert [path.name for path in manager._find_backups("proj")] == [archive.name]
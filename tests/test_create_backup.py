@@ -0,0 +1,26 @@
+import os
+import shutil
+import subprocess
+import tarfile
+from pathlib import Path
+
+import pytest
+
+
+def test_large_png_reads_back(backup, monkeypatch):
+    gzip_bin = shutil.which("gzip")
+    # Take the in-process writer, which stores incompressible files in their own gzip member.
+    monkeypatch.setattr(backup.shutil, "which", lambda name: None)
+    image = os.urandom(3 << 19)
+    Path("image.png").write_bytes(image)
+    Path("notes.txt").write_text("notes " * 1000)
+
+    archive = backup.BackupManager().create_backup("proj")
+
+    with tarfile.open(archive, "r:gz") as tar:
+        assert tar.extractfile("image.png").read() == image
+        assert tar.extractfile("notes.txt").read() == b"notes " * 1000
+
+    if gzip_bin is None:
+        pytest.skip("gzip is not installed")
+    subprocess.run([gzip_bin, "-t", str(archive)], check=True)
@@ -0,0 +1,106 @@
+import pickle
+import re
+from pathlib import Path
+
+import pytest
+
+
+def test_legacy_pickled_patterns_round_trip(backup):
+    rules_file = backup.backup_path / "excludes.exc"
+    # Older versions appended a full list of compiled patterns on every write.
+    with open(rules_file, "ab") as f:
+        pickle.dump([(re.compile(r"^build$"), backup.EXACT)], f)
+    with open(rules_file, "ab") as f:
+        pickle.dump(
+            [
+                (re.compile(r"^build$"), backup.EXACT),
+                (re.compile(r"^dist/.*?"), backup.WILDCARD),
+            ],
+            f,
+        )
+
+    rules = backup._read_exclude_rules()
+    assert [(pattern.pattern, match_type) for pattern, match_type in rules] == [
+        (r"^build$", backup.EXACT),
+        (r"^dist/.*?", backup.WILDCARD),
+    ]
+
+    backup._write_exclude_rules(rules)
+    assert backup._read_exclude_rules() == rules
+
+
+def _walked(manager, root):
+    manager._combine_rules()
+    return sorted(
+        rel_path
+        for _, rel_path in manager._walk_directory(root)
+        if not manager._should_exclude(rel_path)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern, match_type, legacy_regex, pruned",
+    [
+        ("dir/**", "wildcard", None, {"dir"}),
+        ("a/b/**", "wildcard", None, {"a/b"}),
+        ("a*/**", "wildcard", None, set()),
+        ("dir/**", "exact", None, {"dir"}),
+        (None, "wildcard", r"^dir/[^/]*[^/]*(/.*)?$", {"dir"}),
+    ],
+    ids=["dir", "nested", "wildcard-dir", "exact", "legacy"],
+)
+def test_pruned_walk_matches_full_walk(
+    backup, monkeypatch, pattern, match_type, legacy_regex, pruned
+):
+    for rel_path in [
+        "dir/f",
+        "dir/sub/g",
+        "dira/h",
+        "a/b/c/i",
+        "a/bb/j",
+        "a/k",
+        "abc/l",
+        "xdir/dir/m",
+        "top.txt",
+    ]:
+        Path(rel_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(rel_path).write_text(rel_path)
+
+    manager = backup.BackupManager()
+    if legacy_regex is None:
+        manager.add_exclusion_rule(pattern, match_type)
+    else:
+        manager.exclude_rules.append((re.compile(legacy_regex), match_type))
+
+    pruned_walk = _walked(manager, ".")
+    assert manager._dir_prefixes == pruned
+
+    # A regex that never matches turns off directory pruning entirely.
+    monkeypatch.setattr(backup, "_DIR_RULE_RE", re.compile(r"(?!)"))
+    full_walk = _walked(manager, ".")
+    assert manager._dir_prefixes == set()
+
+    assert pruned_walk == full_walk
+
+
+@pytest.mark.parametrize(
+    "pattern, regex",
+    [
+        ("build/**", r"^build/.*?(/.*)?$"),
+        ("*.log", r"^[^/]*\.log$"),
+        ("src/**/*.pyc", r"^src/.*?/[^/]*\.pyc(/.*)?$"),
+    ],
+)
+def test_translate_pattern_keeps_double_star_apart(backup, pattern, regex):
+    assert backup._translate_pattern(pattern) == regex
+
+
+def test_translated_patterns_match_paths(backup):
+    double = re.compile(backup._translate_pattern("src/**/*.pyc"))
+    single = re.compile(backup._translate_pattern("*.log"))
+
+    # "**" crosses directories, "*" stays within one path component.
+    assert double.fullmatch("src/pkg/sub/mod.pyc")
+    assert not double.fullmatch("src/pkg/mod.py")
+    assert single.fullmatch("debug.log")
+    assert not single.fullmatch("logs/debug.log")